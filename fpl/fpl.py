@@ -37,19 +37,58 @@ from .models.h2h_league import H2HLeague
 from .models.player import Player, PlayerSummary
 from .models.team import Team
 from .models.user import User
-from .utils import (average, fetch, get_current_user, logged_in,
-                    position_converter, scale, team_converter, ssl_context)
+from .utils import (average, bootstrap_cache, fetch, get_bootstrap_static,
+                    get_current_user, logged_in, position_converter, scale,
+                    team_converter, ssl_context)
 from urllib.request import urlopen
 
 
 class FPL:
     """The FPL class."""
 
-    def __init__(self, session):
+    def __init__(self, session, load=True):
         self.session = session
 
-        resp = urlopen(API_URLS["static"], context=ssl_context)
-        static = json.loads(resp.read().decode("utf-8"))
+        if load:
+            static = bootstrap_cache.cached()
+            if static is None:
+                resp = urlopen(API_URLS["static"], context=ssl_context)
+                static = json.loads(resp.read().decode("utf-8"))
+                bootstrap_cache.set(static)
+            self._set_static(static)
+
+    @classmethod
+    async def create(cls, session):
+        """Returns a new :class:`FPL` object whose bootstrap data is fetched
+        asynchronously using the given ``session``. Prefer this over
+        ``FPL(session)`` when running inside an event loop, as the latter
+        blocks while downloading the bootstrap data.
+
+        :param aiohttp.ClientSession session: The session used for requests.
+        :rtype: :class:`FPL`
+        """
+        fpl = cls(session, load=False)
+        await fpl.load()
+        return fpl
+
+    async def load(self):
+        """Fetches the bootstrap data without blocking the event loop. The
+        data is shared with other :class:`FPL` objects through
+        :data:`fpl.utils.bootstrap_cache`, and concurrent calls share a single
+        in-flight request.
+
+        Information is taken from:
+            https://fantasy.premierleague.com/api/bootstrap-static/
+        """
+        static = await get_bootstrap_static(self.session)
+        self._set_static(static)
+
+    def _set_static(self, static):
+        """Sets the bootstrap data as attributes of the :class:`FPL` object,
+        converting lists of objects with IDs to dicts keyed by their ID.
+
+        :param dict static: The bootstrap-static data.
+        """
         for k, v in static.items():
             try:
                 v = {w["id"]: w for w in v}
@@ -255,7 +294,8 @@ class FPL:
         if include_summary:
             player_summary = await self.get_player_summary(
                 player["id"], return_json=True)
-            player.update(player_summary)
+            # Copy so the shared bootstrap data is left untouched
+            player = dict(player, **player_summary)
 
         if return_json:
             return player
@@ -452,6 +492,8 @@ class FPL:
             raise ValueError(f"Gameweek with ID {gameweek_id} not found")
 
         if include_live:
+            # Copy so the shared bootstrap data is left untouched
+            static_gameweek = dict(static_gameweek)
             live_gameweek = await fetch(
                 self.session, API_URLS["gameweek_live"].format(gameweek_id))
 
@@ -1,5 +1,5 @@
 from ..constants import API_URLS
-from ..utils import fetch
+from ..utils import fetch, get_bootstrap_static
 from .player import Player
 
 
@@ -44,7 +44,7 @@ class Team():
         team_players = getattr(self, "players", [])
 
         if not team_players:
-            players = await fetch(self._session, API_URLS["static"])
+            players = await get_bootstrap_static(self._session)
             players = players["elements"]
             team_players = [player for player in players
                             if player["team"] == self.id]
@@ -6,7 +6,8 @@ import aiohttp
 from urllib3.util import response
 
 from ..constants import API_URLS, MIN_GAMEWEEK, MAX_GAMEWEEK
-from ..utils import fetch, logged_in, post, post_transfer, get_headers
+from ..utils import (fetch, get_bootstrap_static, logged_in, post,
+                     post_transfer, get_headers)
 
 is_c = "is_captain"
 is_vc = "is_vice_captain"
@@ -583,7 +584,7 @@ class User():
             raise Exception(
                 "Cannot transfer a player out who is not in the user's team.")
 
-        players = await fetch(self._session, API_URLS["static"])
+        players = await get_bootstrap_static(self._session)
         players = players["elements"]
         player_ids = [player["id"] for player in players]
 
@@ -628,7 +629,7 @@ class User():
         :rtype: list
         """
 
-        players = await fetch(self._session, API_URLS["static"])
+        players = await get_bootstrap_static(self._session)
         players = players["elements"]
         _set_element_type(lineup, players)
 
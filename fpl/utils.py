@@ -1,32 +1,446 @@
 import asyncio
 import aiohttp
 import certifi
+import collections
+import contextlib
+import random
 import ssl
+import time
 
 from json import JSONDecodeError
 from aiohttp import ClientResponse
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from fpl.constants import API_URLS
 from functools import update_wrapper
+from urllib.parse import urlsplit
 
 headers = {"User-Agent": ""}
 ssl_context = ssl.create_default_context(cafile=certifi.where())
 
-async def fetch(session, url, retries=10, cooldown=1):
+class RequestScheduler:
+    """Limits the number of requests that are in flight at the same time,
+    both in total and per host, and optionally the number of requests started
+    per second. Requests that cannot start yet are queued in FIFO order.
+
+    :param int max_concurrency: (optional) Maximum number of requests in
+        flight. Defaults to 50.
+    :param int max_per_host: (optional) Maximum number of requests in flight
+        to a single host. Defaults to 10.
+    :param requests_per_second: (optional) Maximum number of requests started
+        per second. ``None`` means unlimited. Defaults to ``None``.
+    :type requests_per_second: int, float or None
+    """
+
+    def __init__(self, max_concurrency=50, max_per_host=10,
+                 requests_per_second=None):
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.requests_per_second = requests_per_second
+        self.in_flight = 0
+        self.total_requests = 0
+        self._in_flight_per_host = collections.Counter()
+        self._waiters = collections.deque()
+        self._next_start = 0.0
+
+    @property
+    def queue_depth(self):
+        """The number of requests waiting for a free slot.
+
+        :rtype: int
+        """
+        return len(self._waiters)
+
+    def configure(self, max_concurrency=None, max_per_host=None,
+                  requests_per_second=None):
+        """Updates the scheduler's limits. Limits that are not given are left
+        unchanged.
+        """
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        if max_per_host is not None:
+            self.max_per_host = max_per_host
+        if requests_per_second is not None:
+            self.requests_per_second = requests_per_second
+        self._wake()
+
+    def stats(self):
+        """Returns the number of queued and in-flight requests.
+
+        :rtype: dict
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "in_flight_per_host": dict(self._in_flight_per_host),
+            "total_requests": self.total_requests,
+        }
+
+    @contextlib.asynccontextmanager
+    async def slot(self, url):
+        """Asynchronous context manager that waits until a request to ``url``
+        is allowed to start, and frees the slot when it exits.
+
+        :param string url: The URL that is going to be requested.
+        """
+        host = urlsplit(url).netloc
+        await self._acquire(host)
+        try:
+            await self._throttle()
+            yield
+        finally:
+            self._release(host)
+
+    def _can_start(self, host):
+        return (self.in_flight < self.max_concurrency and
+                self._in_flight_per_host[host] < self.max_per_host)
+
+    def _start(self, host):
+        self.in_flight += 1
+        self.total_requests += 1
+        self._in_flight_per_host[host] += 1
+
+    def _release(self, host):
+        self.in_flight -= 1
+        self._in_flight_per_host[host] -= 1
+        if not self._in_flight_per_host[host]:
+            del self._in_flight_per_host[host]
+        self._wake()
+
+    def _wake(self):
+        """Starts as many queued requests as the limits allow, skipping those
+        whose host is at its limit.
+        """
+        for waiter in list(self._waiters):
+            if self.in_flight >= self.max_concurrency:
+                break
+
+            host, future = waiter
+            if future.done():
+                self._waiters.remove(waiter)
+            elif self._can_start(host):
+                self._waiters.remove(waiter)
+                self._start(host)
+                future.set_result(None)
+
+    async def _acquire(self, host):
+        if not self._waiters and self._can_start(host):
+            self._start(host)
+            return
+
+        future = asyncio.get_event_loop().create_future()
+        waiter = (host, future)
+        self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just before the task was cancelled
+                self._release(host)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    async def _throttle(self):
+        if not self.requests_per_second:
+            return
+
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + 1.0 / self.requests_per_second
+
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+scheduler = RequestScheduler()
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Requests are retried on connection errors, timeouts, non-JSON responses
+    (e.g. while the game is being updated) and on the configured status codes.
+    The delay before each retry is drawn from an exponential backoff with full
+    jitter, unless the response includes a ``Retry-After`` header. Retries are
+    counted per URL in :attr:`stats`.
+
+    :param int max_retries: (optional) Maximum number of retries per call.
+        Defaults to 10.
+    :param float base_delay: (optional) Backoff delay of the first retry in
+        seconds, which doubles on each following retry. Defaults to 0.5.
+    :param float max_delay: (optional) Maximum backoff delay in seconds.
+        Defaults to 30.
+    :param retry_statuses: (optional) HTTP status codes that are retried.
+        Defaults to 408, 429, 500, 502, 503 and 504.
+    :param deadline: (optional) Maximum number of seconds a single call may
+        take, including retries. ``None`` means no deadline.
+    :type deadline: int, float or None
+    """
+
+    def __init__(self, max_retries=10, base_delay=0.5, max_delay=10,
+                 retry_statuses=(408, 429, 500, 502, 503, 504),
+                 deadline=None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.deadline = deadline
+        self.stats = collections.defaultdict(collections.Counter)
+
+    def is_retryable_status(self, status):
+        """Returns ``True`` if a response with the given status is retried.
+
+        :rtype: bool
+        """
+        return status in self.retry_statuses
+
+    def get_delay(self, retry, retry_after=None, base_delay=None):
+        """Returns the number of seconds to wait before the given retry.
+
+        :param int retry: The retry number, starting at 0.
+        :param retry_after: (optional) The delay requested by the server.
+        :param base_delay: (optional) Overrides :attr:`base_delay`.
+        :rtype: float
+        """
+        if retry_after is not None:
+            return retry_after
+
+        if base_delay is None:
+            base_delay = self.base_delay
+
+        return random.uniform(0, min(self.max_delay, base_delay * 2 ** retry))
+
+    def record(self, url, event):
+        """Increments the counter of ``event`` for the given URL."""
+        self.stats[url][event] += 1
+
+    def reset_stats(self):
+        """Clears the per-URL retry statistics."""
+        self.stats.clear()
+
+
+retry_policy = RetryPolicy()
+
+
+class _RetryableStatus(Exception):
+    """Raised when a response has a status code that should be retried."""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"Response status {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """Returns the number of seconds in a ``Retry-After`` header, which is
+    either a number of seconds or an HTTP date.
+
+    :param value: The header's value.
+    :type value: string or None
+    :rtype: float or None
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+async def _get_json(session, url, policy):
+    async with scheduler.slot(url), session.get(
+            url, headers=headers, ssl=ssl_context) as response:
+        if policy.is_retryable_status(response.status):
+            raise _RetryableStatus(
+                response.status,
+                parse_retry_after(response.headers.get("Retry-After")))
+
+        return await response.json()
+
+
+async def fetch(session, url, retries=None, cooldown=None, policy=None,
+                deadline=None):
+    """Returns the decoded JSON response of a GET request to ``url``, retrying
+    transient failures according to the retry policy.
+
+    :param aiohttp.ClientSession session: The session used for the request.
+    :param string url: The URL to request.
+    :param int retries: (optional) Overrides the policy's maximum number of
+        retries.
+    :param float cooldown: (optional) Overrides the policy's base delay.
+    :param policy: (optional) The retry policy. Defaults to
+        :data:`retry_policy`.
+    :type policy: :class:`RetryPolicy`
+    :param float deadline: (optional) Overrides the policy's deadline.
+    :raises Exception: if the request still fails after all retries, or the
+        deadline is exceeded.
+    """
+    if policy is None:
+        policy = retry_policy
+    if retries is None:
+        retries = policy.max_retries
+    if deadline is None:
+        deadline = policy.deadline
+
+    started = time.monotonic()
     retries_count = 0
+
     while True:
         try:
-            async with session.get(url, headers=headers, ssl=ssl_context) as response:
-                result = await response.json()
-                return result
-        except aiohttp.client_exceptions.ContentTypeError:
-            retries_count += 1
-            
-            if retries_count > retries:
-                raise Exception(f"Could not fetch {url} after {retries} retries")
-            
-            if cooldown:
-                await asyncio.sleep(cooldown)
+            if deadline is None:
+                return await _get_json(session, url, policy)
+
+            remaining = max(0.0, deadline - (time.monotonic() - started))
+            return await asyncio.wait_for(
+                _get_json(session, url, policy), remaining)
+        except (_RetryableStatus,
+                aiohttp.ContentTypeError,
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                asyncio.TimeoutError) as error:
+            retry_after = getattr(error, "retry_after", None)
+            last_error = error
+
+        if retries_count >= retries:
+            policy.record(url, "failures")
+            raise Exception(
+                f"Could not fetch {url} after {retries} retries"
+            ) from last_error
+
+        delay = policy.get_delay(retries_count, retry_after, cooldown)
+        if (deadline is not None and
+                time.monotonic() - started + delay >= deadline):
+            policy.record(url, "failures")
+            raise Exception(
+                f"Could not fetch {url} within {deadline} seconds"
+            ) from last_error
+
+        retries_count += 1
+        policy.record(url, "retries")
+        await asyncio.sleep(delay)
+
+
+class BootstrapCache:
+    """A process-wide cache of the bootstrap-static data, shared by all
+    :class:`FPL <fpl.FPL>` objects and models.
+
+    Concurrent callers running in the same event loop share a single in-flight
+    request. Callers must treat the returned data as read-only.
+
+    :param ttl: (optional) Number of seconds the data is considered fresh.
+        ``None`` keeps it until :meth:`invalidate` is called. Defaults to 300.
+    :type ttl: int, float or None
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._static = None
+        self._fetched_at = None
+        self._requests = {}
+
+    def is_fresh(self):
+        """Returns ``True`` if the cached data has not expired yet.
+
+        :rtype: bool
+        """
+        if self._static is None:
+            return False
+
+        if self.ttl is None:
+            return True
+
+        return time.monotonic() - self._fetched_at < self.ttl
+
+    def cached(self):
+        """Returns the cached data if it is fresh, otherwise ``None``.
+
+        :rtype: dict or None
+        """
+        if self.is_fresh():
+            self.hits += 1
+            return self._static
+        return None
+
+    def set(self, static):
+        """Stores the given bootstrap-static data.
+
+        :param dict static: The bootstrap-static data.
+        """
+        self._static = static
+        self._fetched_at = time.monotonic()
+
+    def invalidate(self):
+        """Discards the cached data, so the next call refetches it."""
+        self._static = None
+        self._fetched_at = None
+
+    async def get(self, session):
+        """Returns the bootstrap-static data, fetching it with the given
+        ``session`` if the cached data has expired.
+
+        :param aiohttp.ClientSession session: The session used for the request.
+        :rtype: dict
+        """
+        static = self.cached()
+        if static is not None:
+            return static
+
+        loop = asyncio.get_event_loop()
+        request = self._requests.get(loop)
+
+        if request is None:
+            self.misses += 1
+            request = asyncio.ensure_future(self._fetch(session))
+            self._requests[loop] = request
+            request.add_done_callback(
+                lambda _: self._requests.pop(loop, None))
+        else:
+            self.hits += 1
+
+        return await asyncio.shield(request)
+
+    async def _fetch(self, session):
+        static = await fetch(session, API_URLS["static"])
+        self.set(static)
+        return static
+
+    def stats(self):
+        """Returns the cache's hit and miss counters, and the age of the
+        cached data in seconds.
+
+        :rtype: dict
+        """
+        age = None
+        if self._fetched_at is not None:
+            age = time.monotonic() - self._fetched_at
+
+        return {"hits": self.hits, "misses": self.misses, "age": age}
+
+
+bootstrap_cache = BootstrapCache()
+
+
+async def get_bootstrap_static(session):
+    """Returns the bootstrap-static data from the shared
+    :data:`bootstrap_cache`.
+
+    :param aiohttp.ClientSession session: The session used for the request.
+    :rtype: dict
+    """
+    return await bootstrap_cache.get(session)
 
 
 async def post(session, url, payload, headers):
@@ -62,8 +476,7 @@ async def get_total_players(session):
     :param aiohttp.ClientSession session: A logged in user's session.
     :rtype: int
     """
-    static = await fetch(
-        session, "https://fantasy.premierleague.com/api/bootstrap-static/")
+    static = await get_bootstrap_static(session)
 
     return static["total_players"]
 
@@ -74,8 +487,7 @@ async def get_current_gameweek(session):
     :param aiohttp.ClientSession session: A logged in user's session.
     :rtype: int
     """
-    static = await fetch(
-        session, "https://fantasy.premierleague.com/api/bootstrap-static/")
+    static = await get_bootstrap_static(session)
 
     current_gameweek = next(event for event in static["events"]
                             if event["is_current"])
@@ -34,7 +34,7 @@ def tests_setup_and_teardown():
 @pytest_asyncio.fixture()
 async def fpl():
     session = aiohttp.ClientSession()
-    fpl = FPL(session)
+    fpl = await FPL.create(session)
     yield fpl
     await session.close()
 
@@ -1,3 +1,5 @@
+import asyncio
+
 import aiohttp
 import pytest
 
@@ -9,6 +11,7 @@ from fpl.models.h2h_league import H2HLeague
 from fpl.models.player import Player, PlayerSummary
 from fpl.models.team import Team
 from fpl.models.user import User
+from fpl.utils import bootstrap_cache
 from tests.helper import AsyncMock
 
 
@@ -35,6 +38,28 @@ class TestFPL:
         assert all([isinstance(getattr(fpl, key), int) for key in keys[-2:]])
         await session.close()
 
+    @pytest.mark.asyncio
+    async def test_create_shares_single_request(self, mocker):
+        static = {
+            "events": [{"id": 1, "is_current": True}],
+            "teams": [{"id": 1, "name": "Arsenal"}],
+            "total_players": 100,
+        }
+        mocked_fetch = mocker.patch(
+            "fpl.utils.fetch", return_value=static, new_callable=AsyncMock)
+        bootstrap_cache.invalidate()
+        session = aiohttp.ClientSession()
+        fpls = await asyncio.gather(*[FPL.create(session) for _ in range(5)])
+        bootstrap_cache.invalidate()
+        mocked_fetch.assert_called_once()
+
+        for fpl in fpls:
+            assert fpl.session is session
+            assert fpl.current_gameweek == 1
+            assert fpl.teams == {1: {"id": 1, "name": "Arsenal"}}
+            assert fpl.total_players == 100
+        await session.close()
+
     @pytest.mark.asyncio
     async def test_user(self, fpl):
         # test negative id
@@ -1,7 +1,34 @@
+import asyncio
+
+import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from fpl.utils import (BootstrapCache, RequestScheduler, RetryPolicy, fetch,
+                       parse_retry_after, chip_converter, get_current_gameweek,
+                       get_headers, logged_in, position_converter,
+                       team_converter)
+from tests.helper import AsyncMock
+
 
-from fpl.utils import (chip_converter, get_current_gameweek, get_headers,
-                       logged_in, position_converter, team_converter)
+async def serve(*responses):
+    """Returns a started test server that replies with the given responses
+    in order, repeating the last one.
+    """
+    responses = list(responses)
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    server.requests = requests
+    return server
 
 
 class TestUtils:
@@ -39,3 +66,164 @@ class TestUtils:
     def test_get_headers():
         headers = get_headers("123")
         assert isinstance(headers, dict)
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_cache(self, mocker):
+        static = {"total_players": 100}
+        mocked_fetch = mocker.patch(
+            "fpl.utils.fetch", return_value=static, new_callable=AsyncMock)
+        cache = BootstrapCache(ttl=None)
+
+        assert await cache.get(None) is static
+        assert await cache.get(None) is static
+        mocked_fetch.assert_called_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+        cache.invalidate()
+        assert cache.cached() is None
+        assert await cache.get(None) is static
+        assert mocked_fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_cache_expired(self, mocker):
+        mocked_fetch = mocker.patch(
+            "fpl.utils.fetch", return_value={}, new_callable=AsyncMock)
+        cache = BootstrapCache(ttl=0)
+
+        await cache.get(None)
+        await cache.get(None)
+        assert mocked_fetch.call_count == 2
+        assert cache.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_request_scheduler_limits_concurrency(self):
+        scheduler = RequestScheduler(max_concurrency=2, max_per_host=2)
+        observed = []
+
+        async def request(url):
+            async with scheduler.slot(url):
+                observed.append((scheduler.in_flight, scheduler.queue_depth))
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[request("https://a.com/") for _ in range(6)])
+        assert max(in_flight for in_flight, _ in observed) == 2
+        assert max(queue_depth for _, queue_depth in observed) > 0
+        assert scheduler.stats() == {
+            "queue_depth": 0,
+            "in_flight": 0,
+            "in_flight_per_host": {},
+            "total_requests": 6,
+        }
+
+    @pytest.mark.asyncio
+    async def test_request_scheduler_limits_per_host(self):
+        scheduler = RequestScheduler(max_concurrency=10, max_per_host=1)
+        per_host = []
+
+        async def request(url):
+            async with scheduler.slot(url):
+                per_host.append(dict(scheduler._in_flight_per_host))
+                await asyncio.sleep(0.01)
+
+        urls = ["https://a.com/", "https://b.com/"] * 3
+        await asyncio.gather(*[request(url) for url in urls])
+        assert all(count == 1 for hosts in per_host
+                   for count in hosts.values())
+        assert max(len(hosts) for hosts in per_host) == 2
+
+    @pytest.mark.asyncio
+    async def test_request_scheduler_cancelled_waiter(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def request():
+            async with scheduler.slot("https://a.com/"):
+                await release.wait()
+
+        first = asyncio.ensure_future(request())
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(request())
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 1
+
+        second.cancel()
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 0
+
+        release.set()
+        await first
+        assert scheduler.in_flight == 0
+
+    @staticmethod
+    def test_parse_retry_after():
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_retries_retryable_status(self):
+        server = await serve(
+            web.json_response({}, status=503),
+            web.json_response({}, status=429, headers={"Retry-After": "0"}),
+            web.json_response({"id": 1}))
+        policy = RetryPolicy(base_delay=0)
+        url = str(server.make_url("/fixtures/"))
+
+        async with aiohttp.ClientSession() as session:
+            result = await fetch(session, url, policy=policy)
+
+        assert result == {"id": 1}
+        assert len(server.requests) == 3
+        assert policy.stats[url]["retries"] == 2
+        await server.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_does_not_retry_client_errors(self):
+        server = await serve(
+            web.json_response({"detail": "Not found."}, status=404))
+        policy = RetryPolicy(base_delay=0)
+
+        async with aiohttp.ClientSession() as session:
+            result = await fetch(
+                session, str(server.make_url("/")), policy=policy)
+
+        assert result == {"detail": "Not found."}
+        assert len(server.requests) == 1
+        assert not policy.stats
+        await server.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_gives_up_after_retries(self):
+        server = await serve(web.Response(text="The game is being updated."))
+        policy = RetryPolicy(max_retries=2, base_delay=0)
+        url = str(server.make_url("/"))
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(Exception):
+                await fetch(session, url, policy=policy)
+
+        assert len(server.requests) == 3
+        assert policy.stats[url] == {"retries": 2, "failures": 1}
+        await server.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_deadline(self):
+        server = await serve(
+            web.json_response({}, status=503, headers={"Retry-After": "10"}))
+        policy = RetryPolicy(deadline=1)
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(Exception):
+                await fetch(session, str(server.make_url("/")), policy=policy)
+
+        assert len(server.requests) == 1
+        await server.close()
+
+    @staticmethod
+    def test_retry_policy_backoff():
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        assert policy.get_delay(0, retry_after=3) == 3
+        for retry in range(10):
+            assert 0 <= policy.get_delay(retry) <= min(5, 2 ** retry)